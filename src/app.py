@@ -5,9 +5,12 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, Response
+from pydantic import BaseModel, Field
+import hashlib
+import orjson
 import os
 from pathlib import Path
 
@@ -81,30 +84,75 @@ activities = {
 }
 
 
+class SignupRequest(BaseModel):
+    model_config = {"str_strip_whitespace": True}
+
+    email: str = Field(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+# Encoded /activities response and its ETag, rebuilt on the first GET after
+# a signup. The handlers are async and run on the event loop, so reads,
+# cache rebuilds and signups never interleave as long as there is no await
+# between a check and the matching update.
+_activities_cache: tuple[bytes, str] | None = None
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @app.get("/")
-def root():
+async def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+async def get_activities(request: Request):
+    global _activities_cache
+    cached = _activities_cache
+    if cached is None:
+        payload = orjson.dumps(activities)
+        etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+        cached = _activities_cache = (payload, etag)
+    payload, etag = cached
+
+    # Participant emails are student data, so keep them out of shared caches,
+    # and revalidate every GET so a signup shows up on the next reload
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json",
+                    headers=headers)
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+async def signup_for_activity(activity_name: str,
+                              body: SignupRequest) -> dict[str, str]:
     """Sign up a student for an activity"""
+    global _activities_cache
+    email = body.email
     # Validate activity exists
-    if activity_name not in activities:
+    activity = activities.get(activity_name)
+    if activity is None:
         raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Get the specificy activity
-    activity = activities[activity_name]
-
     # Validate student is not already signed up
-    if email in activity["participants"]:
+    participants = activity["participants"]
+    if email in participants:
         raise HTTPException(status_code=400, detail="Student already signed up")
 
+    # Validate activity is not full
+    if len(participants) >= activity["max_participants"]:
+        raise HTTPException(status_code=400, detail="Activity is full")
+
     # Add student
-    activity["participants"].append(email)
+    participants.append(email)
+    _activities_cache = None
     return {"message": f"Signed up {email} for {activity_name}"}
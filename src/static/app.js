@@ -73,9 +73,11 @@ document.addEventListener("DOMContentLoaded", () => {
 
     try {
       const response = await fetch(
-        `/activities/${encodeURIComponent(activity)}/signup?email=${encodeURIComponent(email)}`,
+        `/activities/${encodeURIComponent(activity)}/signup`,
         {
           method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({ email }),
         }
       );
 
@@ -86,7 +88,14 @@ document.addEventListener("DOMContentLoaded", () => {
         messageDiv.className = "success";
         signupForm.reset();
       } else {
-        messageDiv.textContent = result.detail || "An error occurred";
+        if (typeof result.detail === "string") {
+          messageDiv.textContent = result.detail;
+        } else if (response.status === 422) {
+          // Request body failed validation; email is the only field
+          messageDiv.textContent = "Invalid email address";
+        } else {
+          messageDiv.textContent = "An error occurred";
+        }
         messageDiv.className = "error";
       }
 
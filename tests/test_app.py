@@ -0,0 +1,103 @@
+import copy
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+
+client = TestClient(app_module.app)
+
+
+@pytest.fixture(autouse=True)
+def reset_activities():
+    original = copy.deepcopy(app_module.activities)
+    app_module._activities_cache = None
+    yield
+    app_module.activities.clear()
+    app_module.activities.update(original)
+    app_module._activities_cache = None
+
+
+@pytest.mark.parametrize("header", ["{etag}", "W/{etag}", '"other", W/{etag}', "*"])
+def test_activities_not_modified(header):
+    etag = client.get("/activities").headers["etag"]
+
+    response = client.get("/activities",
+                          headers={"If-None-Match": header.format(etag=etag)})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_activities_etag_changes_after_signup():
+    etag = client.get("/activities").headers["etag"]
+
+    signup = client.post("/activities/Chess Club/signup",
+                         json={"email": "new@mergington.edu"})
+    response = client.get("/activities", headers={"If-None-Match": etag})
+
+    assert signup.status_code == 200
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert "new@mergington.edu" in response.json()["Chess Club"]["participants"]
+
+
+def test_activities_revalidate_on_every_request():
+    response = client.get("/activities")
+
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+def test_signup_rejects_duplicate():
+    response = client.post("/activities/Chess Club/signup",
+                           json={"email": "michael@mergington.edu"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Student already signed up"}
+
+
+def test_signup_rejects_full_activity():
+    activity = app_module.activities["Math Olympiad"]
+    for i in range(activity["max_participants"] - len(activity["participants"])):
+        response = client.post("/activities/Math Olympiad/signup",
+                               json={"email": f"student{i}@mergington.edu"})
+        assert response.status_code == 200
+
+    response = client.post("/activities/Math Olympiad/signup",
+                           json={"email": "late@mergington.edu"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Activity is full"}
+    assert "late@mergington.edu" not in activity["participants"]
+
+
+def test_signup_with_json_body():
+    response = client.post("/activities/Chess Club/signup",
+                           json={"email": "new@mergington.edu"})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "message": "Signed up new@mergington.edu for Chess Club"}
+    assert ("new@mergington.edu"
+            in app_module.activities["Chess Club"]["participants"])
+
+
+def test_signup_strips_email_whitespace():
+    response = client.post("/activities/Chess Club/signup",
+                           json={"email": "  a@b.co  "})
+
+    assert response.status_code == 200
+    assert "a@b.co" in app_module.activities["Chess Club"]["participants"]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"json": {"email": "not-an-email"}},
+    {},
+    {"params": {"email": "new@mergington.edu"}},
+], ids=["malformed-email", "missing-body", "query-param"])
+def test_signup_rejects_invalid_request(kwargs):
+    response = client.post("/activities/Chess Club/signup", **kwargs)
+
+    assert response.status_code == 422
+    assert ("new@mergington.edu"
+            not in app_module.activities["Chess Club"]["participants"])